@@ -1,5 +1,4 @@
 import json
-import copy
 from urllib.parse import urlparse
 
 # --- Configuration ---
@@ -122,7 +121,9 @@ def filter_har_data(har_data: dict) -> dict:
     primary_domain = get_primary_domain(har_data)
     print(f"Identified primary domain: {primary_domain}")
 
-    new_har_data = copy.deepcopy(har_data)
+    # Only 'log.entries' is replaced below, so copy the two enclosing dicts
+    # rather than deep-copying the whole (potentially huge) HAR.
+    new_har_data = {**har_data, 'log': {**har_data['log']}}
     filtered_entries = []
 
     for entry in har_data['log']['entries']:
@@ -1,16 +1,9 @@
-import asyncio
-from playwright.async_api import async_playwright
-from browser_use.llm import ChatOpenAI
-from browser_use.llm import ChatGoogle
-from browser_use import Agent
-from browser_use.browser.session import BrowserSession
-from pathlib import Path
 import json
+import os
+from pathlib import Path
 
-input_url = input("Enter the URL of the site you want to index: ")
-
-custom_instructions = input("Enter any custom instructions for the agent (or enter to skip): ")
-
+# asyncio, playwright, browser_use and google.genai are imported inside the functions
+# that use them so the prompts come up without waiting on those packages.
 
 
 def truncate_strings_recursive(obj, max_length=1000):
@@ -23,7 +16,11 @@ def truncate_strings_recursive(obj, max_length=1000):
     else:
         return obj
 
-async def main():
+async def record_session(input_url, custom_instructions):
+    from playwright.async_api import async_playwright
+    from browser_use.llm import ChatOpenAI
+    from browser_use import Agent
+    from browser_use.browser.session import BrowserSession
 
     runs_dir = Path(__file__).resolve().parent / "runs"
     runs_dir.mkdir(parents=True, exist_ok=True)
@@ -59,37 +56,11 @@ async def main():
     await browser.close()
     await playwright.stop()
 
-asyncio.run(main())
-
-with open("runs/session.har", "r") as f:
-    har = json.load(f)
-
-#recursively truncate all strings to 1000 characters
-har_truncated = truncate_strings_recursive(har, 1000)
-
-
-from filter import filter_har_data
-
-har_filtered = filter_har_data(har_truncated)
-
-
-with open("runs/session_filtered.har", "w") as f:
-    json.dump(har_filtered, f, indent=2)
-
-
-
-print("HAR file truncated and saved as session_filtered.har")
-
 
+def generate(har_filtered):
+    from google import genai
+    from google.genai import types
 
-import base64
-import json
-import os
-from google import genai
-from google.genai import types
-
-
-def generate():
     client = genai.Client(
         api_key=os.environ.get("GEMINI_API_KEY"),
     )
@@ -260,5 +231,31 @@ IMPORTANT:
     with open("documentation.json", "w") as f:
         json.dump(data, f, indent=2)
 
+def main():
+    import asyncio
+
+    input_url = input("Enter the URL of the site you want to index: ")
+
+    custom_instructions = input("Enter any custom instructions for the agent (or enter to skip): ")
+
+    asyncio.run(record_session(input_url, custom_instructions))
+
+    with open("runs/session.har", "r") as f:
+        har = json.load(f)
+
+    #recursively truncate all strings to 1000 characters
+    har_truncated = truncate_strings_recursive(har, 1000)
+
+    from filter import filter_har_data
+
+    har_filtered = filter_har_data(har_truncated)
+
+    with open("runs/session_filtered.har", "w") as f:
+        json.dump(har_filtered, f, indent=2)
+
+    print("HAR file truncated and saved as session_filtered.har")
+
+    generate(har_filtered)
+
 if __name__ == "__main__":
-    generate()
+    main()
@@ -3,28 +3,33 @@ import os
 import subprocess
 import sys
 import tempfile
-import threading
 import time
-from flask import Flask, request, jsonify, send_from_directory
-from flask_cors import CORS
-from openai import OpenAI
-from dotenv import load_dotenv
+from functools import lru_cache
 
-load_dotenv()
+# Flask, flask_cors, the OpenAI SDK and dotenv are imported lazily (inside
+# create_app / get_client) so that importing this module stays cheap for
+# short-lived workers.
 
-app = Flask(__name__)
-CORS(app)
+DOCS_PATH = "/Users/alexanderfavvas/skalex/agent/craigslist_docs.json"
 
-try:
-    with open("/Users/alexanderfavvas/skalex/agent/craigslist_docs.json", "r") as f:
-        docs = json.load(f)
-        #raise FileNotFoundError
-except FileNotFoundError:
-    docs = {"error": "Docs not found"}
+sessions = {}
 
-client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+@lru_cache(maxsize=None)
+def get_docs():
+    try:
+        with open(DOCS_PATH, "r") as f:
+            return json.load(f)
+            #raise FileNotFoundError
+    except FileNotFoundError:
+        return {"error": "Docs not found"}
 
-sessions = {}
+@lru_cache(maxsize=None)
+def get_client():
+    from dotenv import load_dotenv
+    from openai import OpenAI
+
+    load_dotenv()
+    return OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
 
 def get_session(session_id):
     if session_id not in sessions:
@@ -32,7 +37,7 @@ def get_session(session_id):
             "message_history": [
                 {
                     "role": "system",
-                    "content": f"You are a helpful assistant that can execute python code. When executing code, always print the result to stdout (so don't write 'x' to see x, write 'print(x)'). Keep responses concise. Use Markdown sparingly and tastefully: use headers (###) only when they add structure, bullet lists for 3-7 related items, and bold to emphasize a few key phrases. Avoid excessive formatting, emojis, and decorative text. If you get an error, try to fix it immediately after, do not ask for confirmation. Here are some relevant docs: {json.dumps(docs)}"
+                    "content": f"You are a helpful assistant that can execute python code. When executing code, always print the result to stdout (so don't write 'x' to see x, write 'print(x)'). Keep responses concise. Use Markdown sparingly and tastefully: use headers (###) only when they add structure, bullet lists for 3-7 related items, and bold to emphasize a few key phrases. Avoid excessive formatting, emojis, and decorative text. If you get an error, try to fix it immediately after, do not ask for confirmation. Here are some relevant docs: {json.dumps(get_docs())}"
                 }
             ]
         }
@@ -65,12 +70,14 @@ def execute_python_code(code):
             "returncode": 1
         }
 
-@app.route('/')
 def serve_frontend():
+    from flask import send_from_directory
+
     return send_from_directory('../frontend/chat', 'index.html')
 
-@app.route('/chat', methods=['POST'])
 def chat():
+    from flask import request, jsonify
+
     try:
         data = request.get_json(silent=True) or {}
         user_message = str(data.get('message', '')).strip()
@@ -96,7 +103,7 @@ def chat():
         last_execution_result = None
 
         for _ in range(max_tool_iterations):
-            response = client.responses.create(
+            response = get_client().responses.create(
                 model="gpt-4.1",
                 input=message_history,
                 text={"format": {"type": "text"}},
@@ -189,18 +196,44 @@ def chat():
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
-@app.route('/sessions/<session_id>/history', methods=['GET'])
 def get_history(session_id):
+    from flask import jsonify
+
     session = get_session(session_id)
     return jsonify({"history": session["message_history"]})
 
-@app.route('/sessions/<session_id>/clear', methods=['POST'])
 def clear_session(session_id):
+    from flask import jsonify
+
     if session_id in sessions:
         del sessions[session_id]
     return jsonify({"message": "Session cleared"})
 
+def create_app():
+    from flask import Flask
+    from flask_cors import CORS
+
+    app = Flask(__name__)
+    CORS(app)
+    app.add_url_rule('/', view_func=serve_frontend)
+    app.add_url_rule('/chat', view_func=chat, methods=['POST'])
+    app.add_url_rule('/sessions/<session_id>/history', view_func=get_history, methods=['GET'])
+    app.add_url_rule('/sessions/<session_id>/clear', view_func=clear_session, methods=['POST'])
+    return app
+
+_app = None
+
+def __getattr__(name):
+    # Keep `agent:app` working for WSGI servers without building it at import.
+    global _app
+    if name == "app":
+        if _app is None:
+            _app = create_app()
+        return _app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 if __name__ == "__main__":
+    app = create_app()
     print("Starting chat agent server...")
     print("Frontend available at: http://localhost:8000")
     print("API endpoint: http://localhost:8000/chat")
@@ -0,0 +1,72 @@
+"""Measure cold import time of the server and CLI modules with `python -X importtime`.
+
+Usage:
+    python bench_importtime.py [--runs N] [--top K]
+"""
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+# (label, directory the module is run from, module name)
+TARGETS = [
+    ("agent/agent.py", os.path.join(ROOT, "agent"), "agent"),
+    ("CLI/main.py", os.path.join(ROOT, "CLI"), "main"),
+    ("CLI/filter.py", os.path.join(ROOT, "CLI"), "filter"),
+]
+
+LINE_RE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+
+def import_once(cwd, module):
+    """Import `module` in a fresh interpreter and return its -X importtime rows."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=cwd,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1])
+    rows = []
+    for line in result.stderr.splitlines():
+        match = LINE_RE.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            rows.append((name, int(self_us), int(cumulative_us), len(indent)))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5, help="fresh interpreters per target")
+    parser.add_argument("--top", type=int, default=5, help="heaviest direct imports to list")
+    args = parser.parse_args()
+
+    for label, cwd, module in TARGETS:
+        try:
+            runs = [import_once(cwd, module) for _ in range(args.runs)]
+        except RuntimeError as e:
+            print(f"{label}: import failed ({e})")
+            continue
+
+        # The target's own row is printed last; its cumulative time covers
+        # everything it pulled in (interpreter start-up imports are excluded).
+        totals = [rows[-1][2] for rows in runs]
+        print(f"{label}: median {statistics.median(totals) / 1000:.1f} ms, "
+              f"min {min(totals) / 1000:.1f} ms over {args.runs} runs")
+
+        rows = runs[-1]
+        # Direct children of the target follow the previous top-level row.
+        start = max((i for i, row in enumerate(rows[:-1]) if row[3] == 1), default=-1) + 1
+        direct = [row for row in rows[start:-1] if row[3] == 3]
+        for name, _, cumulative, _ in sorted(direct, key=lambda r: r[2], reverse=True)[:args.top]:
+            print(f"    {cumulative / 1000:8.1f} ms  {name}")
+
+
+if __name__ == "__main__":
+    main()